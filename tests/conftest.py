@@ -1,8 +1,10 @@
+import anyio
 import pytest
 from fastapi.testclient import TestClient
 from broadcaster import Broadcast
 
 from websocket.main import app
+from websocket.services.admission import AdmissionController
 from websocket.services.manager import ConnectionTracker
 from websocket.services.unit_of_work import BroadcastUnitOfWork
 
@@ -22,6 +24,7 @@ def client():
     # Set app state
     app.state.ws_manager = ws_manager
     app.state.uow = uow
+    app.state.admission = AdmissionController()
 
     # Create test client
     # TestClient manages its own event loop and will handle cleanup
@@ -32,3 +35,14 @@ def client():
 
     # No cleanup needed - TestClient handles its own event loop lifecycle
     # The broadcaster's background tasks will be cleaned up when TestClient's event loop closes
+
+
+@pytest.fixture
+def shared_loop_client(client):
+    """Run all requests of the test on one event loop, like a single worker"""
+    with anyio.from_thread.start_blocking_portal(**client.async_backend) as portal:
+        client.portal = portal
+        try:
+            yield client
+        finally:
+            client.portal = None
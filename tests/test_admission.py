@@ -0,0 +1,79 @@
+"""Simple tests for connection admission control"""
+
+import pytest
+from starlette.testclient import WebSocketDenialResponse
+
+from websocket.main import app
+from websocket.services.admission import AdmissionController
+
+
+def test_reject_over_max_connections(client):
+    """Test connections above the per-worker limit are denied with 503 and Retry-After"""
+    app.state.admission = AdmissionController(max_connections=1, retry_after=7)
+
+    with client.websocket_connect('/ws') as websocket:
+        assert websocket.receive_json()['type'] == 'welcome'
+
+        with pytest.raises(WebSocketDenialResponse) as exc_info:
+            with client.websocket_connect('/ws'):
+                pass
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers['retry-after'] == '7'
+
+    assert app.state.admission.rejected_total['max_connections'] == 1
+
+
+def test_pending_admissions_count_towards_max_connections(client):
+    """Test handshakes admitted but not yet accepted hold their slot"""
+    admission = AdmissionController(max_connections=2)
+    manager = app.state.ws_manager
+
+    assert admission.admit(manager) is None
+    assert admission.admit(manager) is None
+    assert admission.admit(manager) == 'max_connections'
+
+    admission.release()
+    assert admission.admit(manager) is None
+
+
+def test_reject_over_accept_rate(client):
+    """Test the accept rate token bucket sheds bursts"""
+    admission = AdmissionController(max_accept_rate=1)
+    manager = app.state.ws_manager
+
+    assert admission.admit(manager) is None
+    assert admission.admit(manager) == 'accept_rate'
+
+
+def test_reject_on_loop_lag(client):
+    """Test connections are rejected while the event loop lags"""
+    admission = AdmissionController(max_loop_lag=0.1)
+    admission.loop_lag = 0.5
+
+    assert admission.admit(app.state.ws_manager) == 'loop_lag'
+
+
+def test_load_endpoint(client):
+    """Test load report endpoint"""
+    app.state.admission = AdmissionController(max_connections=10)
+
+    response = client.get('/load')
+    assert response.status_code == 200
+    data = response.json()
+    assert data['connections'] == 0
+    assert data['max_connections'] == 10
+    assert data['accepting'] is True
+
+
+def test_load_report_reflects_accept_rate(client):
+    """Test an exhausted accept rate bucket reports not accepting without consuming tokens"""
+    admission = AdmissionController(max_accept_rate=1)
+    manager = app.state.ws_manager
+
+    assert admission.load_report(manager)['accepting'] is True
+    assert admission.load_report(manager)['accepting'] is True
+
+    assert admission.admit(manager) is None
+    report = admission.load_report(manager)
+    assert report['accepting'] is False
+    assert report['accept_tokens'] < 1
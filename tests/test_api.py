@@ -1,5 +1,11 @@
 """Simple tests for HTTP API endpoints"""
 
+import time
+
+import pytest
+
+from websocket.services.reconnect import maintain_broadcaster_connection
+
 
 def test_root_endpoint(client):
     """Test root endpoint returns HTML page"""
@@ -23,3 +29,97 @@ def test_notify_endpoint_default_message(client):
     assert response.status_code == 200
     data = response.json()
     assert data['status'] == 'success'
+
+
+def test_root_endpoint_precompressed(client):
+    """Test root endpoint serves pre-compressed page for the accepted encoding"""
+    for encoding in ('br', 'gzip'):
+        response = client.get('/', headers={'Accept-Encoding': encoding})
+        assert response.status_code == 200
+        assert response.headers['content-encoding'] == encoding
+        assert response.headers['vary'] == 'Accept-Encoding'
+        assert b'<html' in response.content.lower()
+
+    response = client.get('/', headers={'Accept-Encoding': 'identity'})
+    assert 'content-encoding' not in response.headers
+
+
+def test_root_endpoint_not_modified(client):
+    """Test root endpoint answers 304 for a matching ETag"""
+    etag = client.get('/').headers['etag']
+
+    response = client.get('/', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.headers['etag'] == etag
+    assert response.content == b''
+
+
+def test_ready_endpoint(shared_loop_client):
+    """Test readiness follows the broadcaster connection state"""
+    client = shared_loop_client
+    manager = client.app.state.ws_manager
+
+    response = client.get('/ready')
+    assert response.status_code == 503
+
+    client.portal.call(manager.connect_broadcaster)
+    try:
+        response = client.get('/ready')
+        assert response.status_code == 200
+        assert response.json()['status'] == 'ready'
+
+        manager.initiate_shutdown()
+        assert client.get('/ready').status_code == 503
+    finally:
+        client.portal.call(manager.disconnect_broadcaster)
+
+
+def test_ready_endpoint_after_broadcast_failure(shared_loop_client):
+    """Test readiness drops when publishing and reconnecting the broadcaster fail"""
+    client = shared_loop_client
+    manager = client.app.state.ws_manager
+    client.portal.call(manager.connect_broadcaster)
+    disconnect = manager.broadcaster.disconnect
+    try:
+        assert client.get('/ready').status_code == 200
+
+        async def fail(*args, **kwargs):
+            raise ConnectionError('Redis is down')
+
+        manager.broadcaster.publish = fail
+        manager.broadcaster.connect = fail
+        with pytest.raises(ConnectionError):
+            client.portal.call(manager.broadcast, {'type': 'notification'})
+        assert client.get('/ready').status_code == 503
+    finally:
+        client.portal.call(disconnect)
+
+
+def test_ready_after_broadcaster_recovers(shared_loop_client):
+    """Test the broadcaster is reconnected in the background without any client traffic"""
+    client = shared_loop_client
+    manager = client.app.state.ws_manager
+    connect = manager.broadcaster.connect
+    attempts = []
+
+    async def flaky_connect():
+        attempts.append(time.monotonic())
+        if len(attempts) == 1:
+            raise ConnectionError('Redis is down')
+        await connect()
+
+    manager.broadcaster.connect = flaky_connect
+    with pytest.raises(ConnectionError):
+        client.portal.call(manager.connect_broadcaster)
+    assert client.get('/ready').status_code == 503
+
+    reconnect = client.portal.start_task_soon(maintain_broadcaster_connection, manager, 0.01, 0.05)
+    try:
+        deadline = time.monotonic() + 2
+        while client.get('/ready').status_code != 200:
+            assert time.monotonic() < deadline, 'broadcaster was not reconnected'
+            time.sleep(0.01)
+        assert len(attempts) == 2
+    finally:
+        reconnect.cancel()
+        client.portal.call(manager.disconnect_broadcaster)
@@ -0,0 +1,91 @@
+"""Simple tests for admin diagnostics endpoints"""
+
+import asyncio
+import logging
+import time
+
+import pytest
+
+from websocket.core import settings
+from websocket.services.diagnostics import SlowCallbackWatchdog
+
+HEADERS = {'X-Admin-Token': 'secret'}
+
+
+@pytest.fixture
+def admin_token(monkeypatch):
+    monkeypatch.setattr(settings, 'DIAGNOSTICS_TOKEN', 'secret')
+
+
+def test_diagnostics_disabled_without_token(client):
+    """Test diagnostics are hidden when no admin token is configured"""
+    response = client.get('/admin/tasks', headers=HEADERS)
+    assert response.status_code == 404
+
+
+def test_diagnostics_require_valid_token(client, admin_token):
+    """Test diagnostics reject an invalid admin token"""
+    response = client.get('/admin/tasks', headers={'X-Admin-Token': 'wrong'})
+    assert response.status_code == 403
+
+
+def test_diagnostics_reject_non_ascii_token(client, admin_token):
+    """Test a non-ASCII admin token is rejected instead of failing the request"""
+    response = client.get('/admin/tasks', headers={'X-Admin-Token': 'café'.encode('latin-1')})
+    assert response.status_code == 403
+
+
+def test_tasks_endpoint(shared_loop_client, admin_token):
+    """Test tasks are grouped by coroutine"""
+    with shared_loop_client.websocket_connect('/ws') as websocket:
+        assert websocket.receive_json()['type'] == 'welcome'
+
+        response = shared_loop_client.get('/admin/tasks', headers=HEADERS)
+        assert response.status_code == 200
+        data = response.json()
+        assert data['tasks']['BroadcastUnitOfWork.listen_for_messages'] == 1
+        assert data['total'] == sum(data['tasks'].values())
+
+
+def test_slow_callbacks_endpoint(shared_loop_client, admin_token):
+    """Test slow callback logging threshold can be switched on and off"""
+    response = shared_loop_client.put('/admin/slow-callbacks', params={'threshold': 0.2}, headers=HEADERS)
+    assert response.status_code == 200
+    assert response.json()['threshold'] == 0.2
+
+    response = shared_loop_client.put('/admin/slow-callbacks', params={'threshold': 0}, headers=HEADERS)
+    assert response.json()['threshold'] == 0
+    assert shared_loop_client.get('/admin/slow-callbacks', headers=HEADERS).json()['threshold'] == 0
+
+
+def blocking_callback():
+    time.sleep(0.3)
+
+
+@pytest.mark.asyncio
+async def test_slow_callback_watchdog_logs_loop_stack(caplog):
+    """Test a blocking callback is reported once with the loop thread stack"""
+    watchdog = SlowCallbackWatchdog()
+    watchdog.enable(0.05)
+    try:
+        with caplog.at_level(logging.WARNING, logger='websocket.services.diagnostics'):
+            blocking_callback()
+            await asyncio.sleep(0.1)
+    finally:
+        watchdog.disable()
+
+    reports = [record.getMessage() for record in caplog.records if 'Event loop blocked' in record.getMessage()]
+    assert len(reports) == 1
+    assert 'blocking_callback' in reports[0]
+    assert not asyncio.get_running_loop().get_debug()
+
+
+def test_profile_endpoint(client, admin_token):
+    """Test profiler returns collapsed stacks"""
+    response = client.post('/admin/profile', params={'seconds': 0.1, 'interval': 0.01}, headers=HEADERS)
+    assert response.status_code == 200
+    lines = response.text.splitlines()
+    assert lines
+    stack, count = lines[0].rsplit(' ', 1)
+    assert ';' in stack
+    assert int(count) > 0
@@ -0,0 +1,110 @@
+"""Simple tests for the sharded broadcast bus"""
+
+import asyncio
+import json
+from collections import Counter
+
+import pytest
+from broadcaster import Broadcast
+
+from websocket.services.manager import ConnectionTracker
+from websocket.services.sharding import ShardedBroadcastBackend
+
+NODES = ['memory://node-a', 'memory://node-b', 'memory://node-c']
+
+
+@pytest.mark.parametrize('node_count', [2, 3, 4])
+def test_partitions_spread_evenly(node_count):
+    """Test partitions are spread evenly when their count is a multiple of the node count"""
+    nodes = [f'memory://node-{i}' for i in range(node_count)]
+
+    default = ShardedBroadcastBackend(nodes)
+    assert default.partitions == node_count
+    assert sorted(default.node_for_partition(p) for p in range(default.partitions)) == sorted(nodes)
+
+    backend = ShardedBroadcastBackend(nodes, partitions=node_count * 4)
+    counts = Counter(backend.node_for_partition(p) for p in range(backend.partitions))
+    assert set(counts.values()) == {4}
+
+
+@pytest.mark.asyncio
+async def test_sharded_backend_connects_only_needed_nodes():
+    """Test a worker only opens connections to nodes owning its partitions"""
+    backend = ShardedBroadcastBackend(NODES, partitions=1)
+    broadcast = Broadcast(backend=backend)
+    await broadcast.connect()
+    try:
+        # Only the first node is opened on connect to prove the bus is reachable
+        assert backend.connected_nodes == [NODES[0]]
+
+        async with broadcast.subscribe(channel='notifications') as subscriber:
+            assert backend.connected_nodes == [NODES[0]]
+
+            await broadcast.publish(channel='notifications', message='hello')
+            event = await asyncio.wait_for(subscriber.get(), timeout=1)
+            assert event.channel == 'notifications'
+            assert event.message == 'hello'
+    finally:
+        await broadcast.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_sharded_backend_merges_events_from_all_nodes():
+    """Test events from partitions on different nodes reach the logical channel subscriber"""
+    backend = ShardedBroadcastBackend(NODES)
+    broadcast = Broadcast(backend=backend)
+    await broadcast.connect()
+    try:
+        async with broadcast.subscribe(channel='room') as subscriber:
+            for i in range(len(NODES)):
+                await broadcast.publish(channel='room', message=str(i))
+            events = [await asyncio.wait_for(subscriber.get(), timeout=1) for _ in NODES]
+
+        assert {event.channel for event in events} == {'room'}
+        assert sorted(event.message for event in events) == ['0', '1', '2']
+        assert sorted(backend.connected_nodes) == sorted(NODES)
+    finally:
+        await broadcast.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_sharded_backend_disconnect_survives_failing_node():
+    """Test one failing partition doesn't keep the other partitions and nodes open"""
+    backend = ShardedBroadcastBackend(NODES)
+    await backend.connect()
+    await backend.subscribe('notifications')
+
+    class FailingSubscription:
+        async def __aexit__(self, *args):
+            raise ConnectionError('node down')
+
+    _, pump = backend._subscriptions['notifications:0']
+    backend._subscriptions['notifications:0'] = (FailingSubscription(), pump)
+
+    await backend.disconnect()
+    assert backend._subscriptions == {}
+    assert backend.connected_nodes == []
+
+
+@pytest.mark.asyncio
+async def test_app_broadcasts_spread_across_nodes():
+    """Test the app's single notifications channel is spread evenly over the nodes"""
+    backend = ShardedBroadcastBackend(NODES)
+
+    class ShardedConnectionTracker(ConnectionTracker):
+        def get_broadcaster(self):
+            return Broadcast(backend=backend)
+
+    manager = ShardedConnectionTracker()
+    await manager.broadcaster.connect()
+    try:
+        async with manager.broadcaster.subscribe(channel='notifications') as subscriber:
+            for i in range(30):
+                await manager.broadcast({'type': 'notification', 'message': i})
+
+            received = [json.loads((await asyncio.wait_for(subscriber.get(), timeout=1)).message) for _ in range(30)]
+            assert sorted(message['message'] for message in received) == list(range(30))
+
+        assert backend.published_by_node == dict.fromkeys(NODES, 10)
+    finally:
+        await manager.broadcaster.disconnect()
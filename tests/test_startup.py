@@ -0,0 +1,31 @@
+"""Simple tests for worker cold start"""
+
+import os
+import subprocess
+import sys
+
+# Measured import time of websocket.main is about 520-580 ms, the budget adds a noise margin
+IMPORT_TIME_BUDGET_MS = float(os.getenv('IMPORT_TIME_BUDGET_MS', 750))
+IMPORT_TIME_RUNS = 3
+
+
+def test_worker_import_time_budget():
+    """Test the worker module imports within budget and without loading lazy modules"""
+    code = 'import sys, websocket.main; print("loaded=" + ",".join(m for m in ("uvicorn", "jinja2", "brotli") if m in sys.modules))'
+    timings = []
+    for _ in range(IMPORT_TIME_RUNS):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        )
+        assert result.stdout.strip().splitlines()[-1] == 'loaded='
+
+        # Last importtime line for the module holds its cumulative import time in microseconds
+        line = next(line for line in reversed(result.stderr.splitlines()) if line.rstrip().endswith('| websocket.main'))
+        timings.append(int(line.split('|')[1]) / 1000)
+
+    # The fastest run is the least disturbed by other load on the machine
+    assert min(timings) < IMPORT_TIME_BUDGET_MS
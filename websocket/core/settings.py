@@ -3,6 +3,9 @@ import os
 SHUTDOWN_TIMEOUT = int(os.getenv('SHUTDOWN_TIMEOUT', 30 * 60))
 CHECK_INTERVAL = int(os.getenv('CHECK_INTERVAL', 5))
 PERIODIC_NOTIFICATION = int(os.getenv('PERIODIC_NOTIFICATION', 10))
+# Broadcaster reconnect backoff: first retry delay and cap, in seconds
+BROADCASTER_RECONNECT_INTERVAL = float(os.getenv('BROADCASTER_RECONNECT_INTERVAL', 1))
+BROADCASTER_RECONNECT_MAX_DELAY = float(os.getenv('BROADCASTER_RECONNECT_MAX_DELAY', 30))
 
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 SERVICE_NAME = os.getenv('SERVICE_NAME', 'ws-notification-service')
@@ -10,3 +13,19 @@ REDIS_HOST = os.getenv('REDIS_HOST', 'redis')
 REDIS_PORT = os.getenv('REDIS_PORT', '6379')
 
 REDIS_URL = f'redis://{REDIS_HOST}:{REDIS_PORT}'
+# Comma-separated Redis nodes; with more than one node channel traffic is partitioned across them
+REDIS_URLS = [url.strip() for url in os.getenv('REDIS_URLS', '').split(',') if url.strip()] or [REDIS_URL]
+# Partition channels per logical channel, 0 means one per Redis node
+BUS_PARTITIONS = int(os.getenv('BUS_PARTITIONS', 0))
+
+# Admission control (0 disables the corresponding limit)
+MAX_CONNECTIONS_PER_WORKER = int(os.getenv('MAX_CONNECTIONS_PER_WORKER', 0))
+MAX_ACCEPT_RATE = float(os.getenv('MAX_ACCEPT_RATE', 0))
+MAX_LOOP_LAG = float(os.getenv('MAX_LOOP_LAG', 0))
+LOOP_LAG_CHECK_INTERVAL = float(os.getenv('LOOP_LAG_CHECK_INTERVAL', 0.5))
+ADMISSION_RETRY_AFTER = int(os.getenv('ADMISSION_RETRY_AFTER', 5))
+
+# Diagnostics (admin endpoints are disabled while DIAGNOSTICS_TOKEN is empty)
+DIAGNOSTICS_TOKEN = os.getenv('DIAGNOSTICS_TOKEN', '')
+SLOW_CALLBACK_THRESHOLD = float(os.getenv('SLOW_CALLBACK_THRESHOLD', 0))
+PROFILE_MAX_SECONDS = float(os.getenv('PROFILE_MAX_SECONDS', 60))
@@ -1,5 +1,10 @@
+import secrets
+
+from fastapi import HTTPException
 from starlette.requests import HTTPConnection
 
+from websocket.core import settings
+from websocket.services.admission import AdmissionController
 from websocket.services.manager import AbstractConnectionManager
 from websocket.services.unit_of_work import AbstractUnitOfWork
 
@@ -10,3 +15,17 @@ async def get_ws_manager(request: HTTPConnection) -> AbstractConnectionManager:
 
 async def get_uow(request: HTTPConnection) -> AbstractUnitOfWork:
     return request.app.state.uow
+
+
+async def get_admission(request: HTTPConnection) -> AdmissionController:
+    return request.app.state.admission
+
+
+async def require_admin(request: HTTPConnection) -> None:
+    # Diagnostics are hidden entirely unless a token is configured
+    if not settings.DIAGNOSTICS_TOKEN:
+        raise HTTPException(status_code=404)
+    token = request.headers.get('X-Admin-Token', '')
+    # Compare bytes, compare_digest rejects non-ASCII str and headers are latin-1 decoded
+    if not secrets.compare_digest(token.encode(), settings.DIAGNOSTICS_TOKEN.encode()):
+        raise HTTPException(status_code=403, detail='Invalid admin token')
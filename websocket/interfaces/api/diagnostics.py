@@ -0,0 +1,51 @@
+import asyncio
+import threading
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from websocket.core.settings import PROFILE_MAX_SECONDS
+from websocket.interfaces.api.deps import require_admin
+from websocket.services.diagnostics import (
+    SamplingProfiler,
+    get_slow_callback_threshold,
+    set_slow_callback_threshold,
+    task_summary,
+)
+
+router = APIRouter(prefix='/admin', dependencies=[Depends(require_admin)])
+
+profiler = SamplingProfiler()
+
+
+@router.get('/tasks')
+async def list_tasks():
+    """Running asyncio tasks grouped by coroutine"""
+    tasks = task_summary()
+    return {'total': sum(tasks.values()), 'tasks': tasks}
+
+
+@router.get('/slow-callbacks')
+async def get_slow_callbacks():
+    """Current slow callback logging threshold, 0 means disabled"""
+    return {'threshold': get_slow_callback_threshold()}
+
+
+@router.put('/slow-callbacks')
+async def put_slow_callbacks(threshold: float = Query(ge=0)):
+    """Enable slow callback logging with threshold in seconds, 0 disables it"""
+    set_slow_callback_threshold(threshold)
+    return {'threshold': get_slow_callback_threshold()}
+
+
+@router.post('/profile', response_class=PlainTextResponse)
+async def profile(
+    seconds: float = Query(default=10, gt=0, le=PROFILE_MAX_SECONDS),
+    interval: float = Query(default=0.005, gt=0, le=1),
+):
+    """Sample the event loop thread for N seconds and return collapsed stacks for flamegraphs"""
+    loop_thread_id = threading.get_ident()
+    stacks = await asyncio.to_thread(profiler.run, loop_thread_id, seconds, interval)
+    if stacks is None:
+        raise HTTPException(status_code=409, detail='Profiler is already running')
+    return stacks
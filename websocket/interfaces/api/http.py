@@ -1,22 +1,21 @@
 import time
 
 from fastapi import APIRouter, Depends, Request
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import JSONResponse
 
 from websocket.domain.entities import MessageType
-from websocket.interfaces.api.deps import get_ws_manager
+from websocket.interfaces.api.deps import get_admission, get_ws_manager
+from websocket.interfaces.api.static import main_page
+from websocket.services.admission import AdmissionController
 from websocket.services.manager import AbstractConnectionManager
 
 router = APIRouter()
 
 
-templates = Jinja2Templates(directory='websocket/templates')
-
-
 @router.get('/')
 async def get(request: Request):
     """Simple HTML page for testing WebSocket connections"""
-    return templates.TemplateResponse(request=request, name='main.html')
+    return main_page.response(request)
 
 
 @router.post('/notify')
@@ -30,3 +29,20 @@ async def send_notification(
     notification = {'type': MessageType.notification, 'message': message, 'timestamp': time.time(), 'source': 'api'}
     await manager.broadcast(notification)
     return {'status': 'success', 'message': f'Notification sent to {manager.get_connection_count()} clients'}
+
+
+@router.get('/load')
+async def load_report(
+    manager: AbstractConnectionManager = Depends(get_ws_manager),
+    admission: AdmissionController = Depends(get_admission),
+):
+    """Worker load report for external balancers, built from in-memory counters only"""
+    return admission.load_report(manager)
+
+
+@router.get('/ready')
+async def readiness(manager: AbstractConnectionManager = Depends(get_ws_manager)):
+    """Readiness probe, ready only once the broadcaster is connected"""
+    if not manager.is_ready():
+        return JSONResponse(status_code=503, content={'status': 'not_ready'})
+    return {'status': 'ready'}
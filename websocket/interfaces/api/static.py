@@ -0,0 +1,68 @@
+import gzip
+import hashlib
+from pathlib import Path
+
+from fastapi import Request, Response
+
+TEMPLATES_DIR = Path(__file__).resolve().parents[2] / 'templates'
+
+
+class PrecompressedPage:
+    """Static page rendered once and kept in memory in identity, gzip and br encodings.
+
+    Built lazily on first use (or eagerly at startup via `load()`), so serving it
+    costs only an encoding lookup and a conditional request check.
+    """
+
+    def __init__(self, path: Path, media_type: str = 'text/html; charset=utf-8'):
+        self.path = path
+        self.media_type = media_type
+        self.etag: str | None = None
+        self._bodies: dict[str, bytes] = {}
+
+    def load(self) -> None:
+        # brotli is only needed here, keep it off the import path of the worker
+        import brotli
+
+        body = self.path.read_bytes()
+        # Weak validator: the same ETag covers every encoding of the page
+        self.etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        self._bodies = {
+            'identity': body,
+            'gzip': gzip.compress(body, compresslevel=9, mtime=0),
+            'br': brotli.compress(body, quality=11),
+        }
+
+    @staticmethod
+    def _choose_encoding(accept_encoding: str) -> str:
+        accepted = set()
+        for item in accept_encoding.split(','):
+            coding, _, params = item.partition(';')
+            name, _, value = params.partition('=')
+            try:
+                quality = float(value) if name.strip() == 'q' else 1.0
+            except ValueError:
+                quality = 1.0
+            if quality > 0:
+                accepted.add(coding.strip().lower())
+        for encoding in ('br', 'gzip'):
+            if encoding in accepted:
+                return encoding
+        return 'identity'
+
+    def response(self, request: Request) -> Response:
+        if self.etag is None:
+            self.load()
+
+        headers = {'ETag': self.etag, 'Vary': 'Accept-Encoding', 'Cache-Control': 'no-cache'}
+        if_none_match = request.headers.get('if-none-match', '')
+        if if_none_match.strip() == '*' or self.etag in (tag.strip() for tag in if_none_match.split(',')):
+            return Response(status_code=304, headers=headers)
+
+        encoding = self._choose_encoding(request.headers.get('accept-encoding', ''))
+        if encoding != 'identity':
+            headers['Content-Encoding'] = encoding
+        return Response(content=self._bodies[encoding], media_type=self.media_type, headers=headers)
+
+
+main_page = PrecompressedPage(TEMPLATES_DIR / 'main.html')
@@ -1,8 +1,9 @@
 import logging
 
-from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Depends, Response, WebSocket, WebSocketDisconnect
 
-from websocket.interfaces.api.deps import get_uow, get_ws_manager
+from websocket.interfaces.api.deps import get_admission, get_uow, get_ws_manager
+from websocket.services.admission import AdmissionController
 from websocket.services.manager import AbstractConnectionManager
 from websocket.services.unit_of_work import AbstractUnitOfWork
 
@@ -15,13 +16,24 @@ async def websocket_endpoint(
     websocket: WebSocket,
     manager: AbstractConnectionManager = Depends(get_ws_manager),
     unit_of_work: AbstractUnitOfWork = Depends(get_uow),
+    admission: AdmissionController = Depends(get_admission),
 ):
     # Reject new connections if shutdown is initiated
     if manager.is_shutdown_initiated():
         await websocket.close(code=1001, reason='Server is shutting down')
         return
 
-    connection_id = await manager.connect(websocket)
+    # Shed load before accept() so rejected clients cost no more than the handshake
+    if admission.admit(manager) is not None:
+        await websocket.send_denial_response(
+            Response(status_code=503, headers={'Retry-After': str(admission.retry_after)})
+        )
+        return
+
+    try:
+        connection_id = await manager.connect(websocket)
+    finally:
+        admission.release()
 
     try:
         async with unit_of_work(
@@ -2,15 +2,20 @@ import asyncio
 import logging
 from contextlib import asynccontextmanager
 
-import uvicorn
 from fastapi import FastAPI
 
 from websocket.core.logging import configure_logging
 from websocket.core.middleware import RequestContextMiddleware
+from websocket.core.settings import SLOW_CALLBACK_THRESHOLD
+from websocket.interfaces.api.diagnostics import router as diagnostics_router
 from websocket.interfaces.api.http import router as http_router
+from websocket.interfaces.api.static import main_page
 from websocket.interfaces.api.ws import router as websocket_router
+from websocket.services.admission import AdmissionController
+from websocket.services.diagnostics import set_slow_callback_threshold
 from websocket.services.manager import AbstractConnectionManager, ConnectionTracker
 from websocket.services.notifier import periodic_notifications
+from websocket.services.reconnect import maintain_broadcaster_connection
 from websocket.services.shutdown import graceful_shutdown
 from websocket.services.unit_of_work import AbstractUnitOfWork, BroadcastUnitOfWork
 
@@ -22,47 +27,62 @@ logger = logging.getLogger(__name__)
 logger.info(f'Worker process started with')
 
 notification_task = None  # Background task for periodic notifications
+reconnect_task = None  # Background task keeping the broadcaster connected
 shutdown_task = None  # Shutdown task reference
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global notification_task, shutdown_task
+    global notification_task, reconnect_task, shutdown_task
 
     ws_manager: AbstractConnectionManager = ConnectionTracker()
     uow: AbstractUnitOfWork = BroadcastUnitOfWork
+    admission = AdmissionController()
 
     app.state.ws_manager = ws_manager
     app.state.uow = uow
+    app.state.admission = admission
 
     logger.info('Starting WebSocket server...')
 
+    main_page.load()
+
+    if SLOW_CALLBACK_THRESHOLD > 0:
+        set_slow_callback_threshold(SLOW_CALLBACK_THRESHOLD)
+
     if ws_manager.broadcaster:
         try:
-            await ws_manager.broadcaster.connect()
+            await ws_manager.connect_broadcaster()
             logger.info('Broadcaster connected')
         except Exception as e:
             logger.error(f'Failed to connect broadcaster: {e}')
 
     notification_task = asyncio.create_task(periodic_notifications(ws_manager))
+    if ws_manager.broadcaster:
+        reconnect_task = asyncio.create_task(maintain_broadcaster_connection(ws_manager))
+    admission.start()
 
     yield
 
     logger.info('Shutdown signal received. Starting graceful shutdown...')
 
-    if notification_task:
-        notification_task.cancel()
-        try:
-            await notification_task
-        except asyncio.CancelledError:
-            pass
+    for task in (notification_task, reconnect_task):
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
 
     shutdown_task = asyncio.create_task(graceful_shutdown(ws_manager))
     await shutdown_task
 
+    await admission.stop()
+    set_slow_callback_threshold(0)
+
     if ws_manager.broadcaster:
         try:
-            await ws_manager.broadcaster.disconnect()
+            await ws_manager.disconnect_broadcaster()
             logger.info('Broadcaster disconnected')
         except Exception as e:
             logger.error(f'Error disconnecting broadcaster: {e}')
@@ -75,7 +95,10 @@ app.add_middleware(RequestContextMiddleware)
 # Routers
 app.include_router(websocket_router)
 app.include_router(http_router)
+app.include_router(diagnostics_router)
 
 
 if __name__ == '__main__':
+    import uvicorn
+
     uvicorn.run('main:app', host='0.0.0.0', port=8000, log_level='info')
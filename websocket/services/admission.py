@@ -0,0 +1,141 @@
+import asyncio
+import logging
+import os
+import time
+
+from websocket.core.settings import (
+    ADMISSION_RETRY_AFTER,
+    LOOP_LAG_CHECK_INTERVAL,
+    MAX_ACCEPT_RATE,
+    MAX_CONNECTIONS_PER_WORKER,
+    MAX_LOOP_LAG,
+)
+from websocket.services.manager import AbstractConnectionManager
+
+logger = logging.getLogger(__name__)
+
+# Rejections are logged as a periodic summary so a reconnect storm doesn't flood the logs
+REJECTION_LOG_INTERVAL = 10.0
+
+
+class AdmissionController:
+    """Per-worker admission limits for new WebSocket connections.
+
+    All state lives in plain in-memory counters, so both admission checks
+    and load reports are cheap enough to run on every handshake/poll.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = MAX_CONNECTIONS_PER_WORKER,
+        max_accept_rate: float = MAX_ACCEPT_RATE,
+        max_loop_lag: float = MAX_LOOP_LAG,
+        retry_after: int = ADMISSION_RETRY_AFTER,
+        lag_check_interval: float = LOOP_LAG_CHECK_INTERVAL,
+    ):
+        self.max_connections = max_connections
+        self.max_accept_rate = max_accept_rate
+        self.max_loop_lag = max_loop_lag
+        self.retry_after = retry_after
+        self.lag_check_interval = lag_check_interval
+
+        # Token bucket for the accept rate, burst size equals one second of traffic
+        self._tokens = max(max_accept_rate, 1.0)
+        self._last_refill = time.monotonic()
+
+        self.loop_lag = 0.0
+        # Admitted handshakes not yet registered by the manager (accept() still in flight)
+        self.pending = 0
+        self.accepted_total = 0
+        self.rejected_total: dict[str, int] = {'max_connections': 0, 'accept_rate': 0, 'loop_lag': 0}
+        self._lag_task: asyncio.Task | None = None
+        self._last_rejection_log = 0.0
+
+    def _available_tokens(self, now: float) -> float:
+        return min(max(self.max_accept_rate, 1.0), self._tokens + (now - self._last_refill) * self.max_accept_rate)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = self._available_tokens(now)
+        self._last_refill = now
+
+    def _overload_reason(self, connections: int) -> str | None:
+        if self.max_connections and connections >= self.max_connections:
+            return 'max_connections'
+        if self.max_loop_lag and self.loop_lag > self.max_loop_lag:
+            return 'loop_lag'
+        return None
+
+    def admit(self, manager: AbstractConnectionManager) -> str | None:
+        """Return None if the connection may be accepted, otherwise the rejection reason.
+
+        An admitted connection holds a pending slot until `release()` is called once
+        the manager has registered it (or failed to).
+        """
+        reason = self._overload_reason(manager.get_connection_count() + self.pending)
+        if reason is None and self.max_accept_rate:
+            self._refill()
+            if self._tokens < 1:
+                reason = 'accept_rate'
+            else:
+                self._tokens -= 1
+
+        if reason is None:
+            self.pending += 1
+            self.accepted_total += 1
+        else:
+            self.rejected_total[reason] += 1
+            now = time.monotonic()
+            if now - self._last_rejection_log >= REJECTION_LOG_INTERVAL:
+                self._last_rejection_log = now
+                logger.warning(f'Admission control rejecting connections, totals: {self.rejected_total}')
+        return reason
+
+    def release(self) -> None:
+        self.pending = max(0, self.pending - 1)
+
+    def load_report(self, manager: AbstractConnectionManager) -> dict:
+        """Snapshot of the worker load for external balancers"""
+        connections = manager.get_connection_count() + self.pending
+        # Peek at the bucket without consuming a token, the report stays side-effect free
+        accept_tokens = self._available_tokens(time.monotonic()) if self.max_accept_rate else None
+        return {
+            'pid': os.getpid(),
+            'connections': connections,
+            'pending': self.pending,
+            'max_connections': self.max_connections,
+            'utilization': connections / self.max_connections if self.max_connections else None,
+            'loop_lag': self.loop_lag,
+            'max_loop_lag': self.max_loop_lag,
+            'max_accept_rate': self.max_accept_rate,
+            'accept_tokens': accept_tokens,
+            'accepted_total': self.accepted_total,
+            'rejected_total': dict(self.rejected_total),
+            'accepting': not manager.is_shutdown_initiated()
+            and self._overload_reason(connections) is None
+            and (accept_tokens is None or accept_tokens >= 1),
+        }
+
+    async def monitor_loop_lag(self):
+        """Measure event loop lag as the oversleep of a periodic sleep"""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                start = loop.time()
+                await asyncio.sleep(self.lag_check_interval)
+                self.loop_lag = max(0.0, loop.time() - start - self.lag_check_interval)
+        except asyncio.CancelledError:
+            logger.debug('Loop lag monitor cancelled')
+
+    def start(self):
+        if self._lag_task is None:
+            self._lag_task = asyncio.create_task(self.monitor_loop_lag())
+
+    async def stop(self):
+        if self._lag_task:
+            self._lag_task.cancel()
+            try:
+                await self._lag_task
+            except asyncio.CancelledError:
+                pass
+            self._lag_task = None
@@ -0,0 +1,126 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+
+logger = logging.getLogger(__name__)
+
+
+def task_summary() -> dict[str, int]:
+    """Count running asyncio tasks grouped by coroutine name"""
+    counts: Counter[str] = Counter()
+    for task in asyncio.all_tasks():
+        coro = task.get_coro()
+        counts[getattr(coro, '__qualname__', type(coro).__name__)] += 1
+    return dict(counts.most_common())
+
+
+class SlowCallbackWatchdog:
+    """Logs the event loop thread's stack when a single callback blocks the loop too long.
+
+    A cheap heartbeat callback on the loop stamps the time, and a watchdog thread
+    reports once per stall when the heartbeat gets older than the threshold.
+    Nothing is scheduled while the threshold is 0.
+    """
+
+    def __init__(self):
+        self.threshold = 0.0
+        self._heartbeat = 0.0
+        self._loop_thread_id: int | None = None
+        self._handle: asyncio.TimerHandle | None = None
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    def _beat(self) -> None:
+        self._heartbeat = time.monotonic()
+        self._handle = asyncio.get_running_loop().call_later(self.threshold / 2, self._beat)
+
+    def _watch(self) -> None:
+        reported_heartbeat = None
+        while not self._stopped.wait(self.threshold / 2):
+            heartbeat = self._heartbeat
+            stalled = time.monotonic() - heartbeat
+            if stalled <= self.threshold or heartbeat == reported_heartbeat:
+                continue
+            reported_heartbeat = heartbeat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = ''.join(traceback.format_stack(frame)) if frame is not None else 'unavailable'
+            logger.warning(
+                f'Event loop blocked for {stalled:.3f}s (threshold {self.threshold}s), loop thread stack:\n{stack}'
+            )
+
+    def enable(self, threshold: float) -> None:
+        """Start watching the running loop, must be called from the loop thread"""
+        self.disable()
+        self.threshold = threshold
+        self._loop_thread_id = threading.get_ident()
+        self._stopped.clear()
+        self._beat()
+        self._thread = threading.Thread(target=self._watch, name='slow-callback-watchdog', daemon=True)
+        self._thread.start()
+        logger.info(f'Slow callback logging enabled with threshold {threshold}s')
+
+    def disable(self) -> None:
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+        self.threshold = 0.0
+        logger.info('Slow callback logging disabled')
+
+
+watchdog = SlowCallbackWatchdog()
+
+
+def set_slow_callback_threshold(threshold: float) -> None:
+    """Log event loop callbacks running longer than threshold seconds, 0 disables logging"""
+    if threshold > 0:
+        watchdog.enable(threshold)
+    else:
+        watchdog.disable()
+
+
+def get_slow_callback_threshold() -> float:
+    return watchdog.threshold
+
+
+class SamplingProfiler:
+    """Samples the stack of one thread and aggregates it into collapsed stacks.
+
+    The output is the `frame;frame;frame count` format consumed by flamegraph.pl and speedscope.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def is_running(self) -> bool:
+        return self._lock.locked()
+
+    def run(self, thread_id: int, seconds: float, interval: float) -> str | None:
+        """Sample thread_id for the given duration, returns None if a profile is already running"""
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            stacks: Counter[str] = Counter()
+            deadline = time.monotonic() + seconds
+            while time.monotonic() < deadline:
+                frame = sys._current_frames().get(thread_id)
+                if frame is None:
+                    break
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f'{code.co_name} ({code.co_filename}:{code.co_firstlineno})')
+                    frame = frame.f_back
+                stacks[';'.join(reversed(stack))] += 1
+                time.sleep(interval)
+            return '\n'.join(f'{stack} {count}' for stack, count in stacks.most_common())
+        finally:
+            self._lock.release()
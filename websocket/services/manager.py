@@ -9,7 +9,8 @@ from uuid import uuid4
 from broadcaster import Broadcast
 from fastapi import WebSocket
 
-from websocket.core.settings import REDIS_URL
+from websocket.core.settings import REDIS_URLS
+from websocket.services.sharding import ShardedBroadcastBackend
 
 logger = logging.getLogger(__name__)
 
@@ -22,11 +23,21 @@ class AbstractConnectionManager(abc.ABC):
         self.shutdown_initiated = False
         self.shutdown_start_time = None
         self.shutdown_start_time = None
+        self._broadcaster_connected = False
         self.broadcaster: Optional[Broadcast] = self.get_broadcaster()
 
     def get_broadcaster(self) -> Optional[Broadcast]:
         return None
 
+    async def connect_broadcaster(self) -> None:
+        self._broadcaster_connected = False
+        await self.broadcaster.connect()
+        self._broadcaster_connected = True
+
+    async def disconnect_broadcaster(self) -> None:
+        self._broadcaster_connected = False
+        await self.broadcaster.disconnect()
+
     async def connect(self, websocket: WebSocket) -> str:
         raise NotImplementedError
 
@@ -42,6 +53,13 @@ class AbstractConnectionManager(abc.ABC):
     def is_shutdown_initiated(self) -> bool:
         return self.shutdown_initiated
 
+    def is_broadcaster_connected(self) -> bool:
+        return self._broadcaster_connected
+
+    def is_ready(self) -> bool:
+        """Ready while the broadcaster is connected and no shutdown has started"""
+        return self._broadcaster_connected and not self.shutdown_initiated
+
     def initiate_shutdown(self):
         self.shutdown_initiated = True
         self.shutdown_start_time = time.time()
@@ -56,7 +74,9 @@ class AbstractConnectionManager(abc.ABC):
 
 class ConnectionTracker(AbstractConnectionManager):
     def get_broadcaster(self) -> Broadcast:
-        return Broadcast(REDIS_URL)
+        if len(REDIS_URLS) > 1:
+            return Broadcast(backend=ShardedBroadcastBackend(REDIS_URLS))
+        return Broadcast(REDIS_URLS[0])
 
     async def connect(self, websocket: WebSocket) -> str:
         await websocket.accept()
@@ -86,10 +106,11 @@ class ConnectionTracker(AbstractConnectionManager):
             await self.broadcaster.publish(channel='notifications', message=json.dumps(message))
             logger.debug(f'Broadcast message published: {message.get("type", "unknown")}')
         except Exception as e:
+            self._broadcaster_connected = False
             logger.error(f'Failed to publish broadcast message: {e}')
             # If broadcaster is not connected, try to connect and retry
             try:
-                await self.broadcaster.connect()
+                await self.connect_broadcaster()
                 await self.broadcaster.publish(channel='notifications', message=json.dumps(message))
                 logger.debug(f'Broadcast message published after reconnect: {message.get("type", "unknown")}')
             except Exception as connect_error:
@@ -0,0 +1,31 @@
+import asyncio
+import logging
+
+from websocket.core.settings import BROADCASTER_RECONNECT_INTERVAL, BROADCASTER_RECONNECT_MAX_DELAY
+from websocket.services.manager import AbstractConnectionManager
+
+logger = logging.getLogger(__name__)
+
+
+async def maintain_broadcaster_connection(
+    manager: AbstractConnectionManager,
+    interval: float = BROADCASTER_RECONNECT_INTERVAL,
+    max_delay: float = BROADCASTER_RECONNECT_MAX_DELAY,
+):
+    """Reconnect the broadcaster with exponential backoff whenever it is not connected"""
+    delay = interval
+    try:
+        while not manager.is_shutdown_initiated():
+            if manager.is_broadcaster_connected():
+                delay = interval
+                await asyncio.sleep(interval)
+                continue
+            try:
+                await manager.connect_broadcaster()
+                logger.info('Broadcaster reconnected')
+            except Exception as e:  # noqa: BLE001 - any backend error means "retry later"
+                logger.warning(f'Broadcaster reconnect failed, retrying in {delay:.1f}s: {e}')
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, max_delay)
+    except asyncio.CancelledError:
+        logger.debug('Broadcaster reconnect task cancelled')
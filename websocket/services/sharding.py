@@ -0,0 +1,127 @@
+import asyncio
+import itertools
+import logging
+from collections import Counter
+from contextlib import AbstractAsyncContextManager
+from typing import Any
+
+from broadcaster import Broadcast, BroadcastBackend, Event
+
+from websocket.core.settings import BUS_PARTITIONS
+
+logger = logging.getLogger(__name__)
+
+
+class ShardedBroadcastBackend(BroadcastBackend):
+    """Broadcaster backend spreading channel traffic across several Redis nodes.
+
+    Every logical channel is split into `partitions` partition channels, and
+    partition N lives on node N modulo the node count. Publishes rotate over the
+    partitions while subscribers listen on all of them, so a single busy channel
+    such as `notifications` is spread evenly over the nodes as long as the
+    partition count is a multiple of the node count. Pub/sub channels hold no
+    state, so there is nothing to rebalance when the node list changes.
+    Ordering is preserved per partition only.
+    """
+
+    def __init__(self, urls: list[str], partitions: int = BUS_PARTITIONS):
+        if not urls:
+            raise ValueError('ShardedBroadcastBackend requires at least one node')
+        self.nodes = sorted(urls)
+        self.partitions = partitions if partitions > 0 else len(self.nodes)
+        self._nodes: dict[str, Broadcast] = {}
+        self._subscriptions: dict[str, tuple[AbstractAsyncContextManager, asyncio.Task]] = {}
+        self._queue: asyncio.Queue[Event] = asyncio.Queue()
+        self._lock = asyncio.Lock()
+        self._rotation = itertools.count()
+        self.published_by_node: Counter[str] = Counter()
+
+    @property
+    def connected_nodes(self) -> list[str]:
+        return list(self._nodes)
+
+    def partition_channels(self, channel: str) -> list[str]:
+        return [f'{channel}:{partition}' for partition in range(self.partitions)]
+
+    def node_for_partition(self, partition: int) -> str:
+        return self.nodes[partition % len(self.nodes)]
+
+    async def connect(self) -> None:
+        # Open one node up front so a connected bus means Redis is reachable,
+        # the remaining nodes are opened on first use of a partition they own
+        await self._connect_node(self.nodes[0])
+
+    async def disconnect(self) -> None:
+        # A failing node must not keep the other partitions and nodes open
+        partition_channels = list(self._subscriptions)
+        results = await asyncio.gather(
+            *(self._unsubscribe_partition(partition_channel) for partition_channel in partition_channels),
+            return_exceptions=True,
+        )
+        for partition_channel, result in zip(partition_channels, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning(f'Error unsubscribing bus partition {partition_channel}: {result}')
+
+        async with self._lock:
+            urls = list(self._nodes)
+            results = await asyncio.gather(
+                *(node.disconnect() for node in self._nodes.values()), return_exceptions=True
+            )
+            self._nodes.clear()
+        for url, result in zip(urls, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning(f'Error disconnecting bus node {url}: {result}')
+
+    async def _connect_node(self, url: str) -> Broadcast:
+        node = self._nodes.get(url)
+        if node is not None:
+            return node
+
+        async with self._lock:
+            if url not in self._nodes:
+                node = Broadcast(url)
+                await node.connect()
+                self._nodes[url] = node
+                logger.info(f'Connected bus node {url}')
+            return self._nodes[url]
+
+    async def _get_node(self, partition: int) -> tuple[str, Broadcast]:
+        url = self.node_for_partition(partition)
+        return url, await self._connect_node(url)
+
+    async def _pump(self, channel: str, subscriber) -> None:
+        """Forward events from one partition channel into the shared queue under the logical channel"""
+        async for event in subscriber:
+            await self._queue.put(Event(channel=channel, message=event.message))
+
+    async def subscribe(self, channel: str) -> None:
+        for partition, partition_channel in enumerate(self.partition_channels(channel)):
+            _, node = await self._get_node(partition)
+            subscription = node.subscribe(channel=partition_channel)
+            subscriber = await subscription.__aenter__()
+            pump = asyncio.create_task(self._pump(channel, subscriber))
+            self._subscriptions[partition_channel] = (subscription, pump)
+
+    async def _unsubscribe_partition(self, partition_channel: str) -> None:
+        subscription, pump = self._subscriptions.pop(partition_channel)
+        pump.cancel()
+        try:
+            await pump
+        except asyncio.CancelledError:
+            pass
+        await subscription.__aexit__(None, None, None)
+
+    async def unsubscribe(self, channel: str) -> None:
+        for partition_channel in self.partition_channels(channel):
+            if partition_channel in self._subscriptions:
+                await self._unsubscribe_partition(partition_channel)
+
+    async def publish(self, channel: str, message: Any) -> None:
+        partition = next(self._rotation) % self.partitions
+        partition_channel = self.partition_channels(channel)[partition]
+        url, node = await self._get_node(partition)
+        await node.publish(channel=partition_channel, message=message)
+        self.published_by_node[url] += 1
+
+    async def next_published(self) -> Event:
+        return await self._queue.get()